@@ -3,15 +3,27 @@
 A small self-contained JDBC MCP server for database querying and schema exploration.
 """
 import sys
+import atexit
+import base64
 import logging
-import json
-from typing import Dict, Any, Optional, List
+import logging.handlers
+import queue
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import MISSING, dataclass, fields
+from itertools import repeat
+from typing import Dict, Any, Optional, List, Iterator, Sequence
 from enum import Enum
 import os
+import re
 import typer
 import jaydebeapi
+import jpype
+import orjson
 from mcp.server import FastMCP
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -22,13 +34,21 @@ log_dir = os.path.dirname(os.path.abspath(__file__))
 log_file = os.path.join(log_dir, "jdbc_mcp.log")
 os.makedirs(log_dir, exist_ok=True)
 
+# Handlers write from a background thread so request handling never blocks on log I/O
+log_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+log_handlers = [logging.StreamHandler(sys.stderr), logging.FileHandler(log_file)]
+for log_handler in log_handlers:
+    log_handler.setFormatter(log_formatter)
+log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stderr),
-        logging.FileHandler(log_file)
-    ]
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    # Records are fully formatted by the listener's handlers
+    format="%(message)s",
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
 logger = logging.getLogger("simple_jdbc")
 logger.info(f"Logging initialized, writing to {log_file}")
@@ -42,67 +62,393 @@ class Transport(str, Enum):
 
 class JdbcConfig(BaseModel):
     """JDBC configuration settings."""
-    jdbc_url: str = Field(default=os.getenv("JDBC_URL", ""), description="JDBC URL (e.g., jdbc:postgresql://localhost:5432/mydb)")
-    jdbc_driver: str = Field(default=os.getenv("JDBC_DRIVER", ""), description="JDBC driver class name")
-    jdbc_driver_path: str = Field(default=os.getenv("JDBC_DRIVER_PATH", ""), description="Path to JDBC driver JAR file")
-    username: str = Field(default=os.getenv("DB_USERNAME", ""), description="Database username")
-    password: str = Field(default=os.getenv("DB_PASSWORD", ""), description="Database password")
+    # Defaults come from the environment, so they need the same checks as passed values
+    model_config = ConfigDict(validate_default=True)
+
+    jdbc_url: str = Field(default_factory=lambda: os.getenv("JDBC_URL", ""), description="JDBC URL (e.g., jdbc:postgresql://localhost:5432/mydb)")
+    jdbc_driver: str = Field(default_factory=lambda: os.getenv("JDBC_DRIVER", ""), description="JDBC driver class name")
+    jdbc_driver_path: str = Field(default_factory=lambda: os.getenv("JDBC_DRIVER_PATH", ""), description="Path to JDBC driver JAR file")
+    username: str = Field(default_factory=lambda: os.getenv("DB_USERNAME", ""), description="Database username")
+    password: str = Field(default_factory=lambda: os.getenv("DB_PASSWORD", ""), description="Database password")
+    pool_size: int = Field(default_factory=lambda: int(os.getenv("JDBC_POOL_SIZE", "25")), description="Maximum number of idle connections kept in the pool", ge=1)
+    statement_cache_size: int = Field(default_factory=lambda: int(os.getenv("JDBC_STATEMENT_CACHE_SIZE", "50")), description="Maximum number of prepared statements cached per connection", ge=1)
+    metadata_cache_ttl: float = Field(default_factory=lambda: float(os.getenv("JDBC_METADATA_CACHE_TTL", "60")), description="Seconds to cache table/column metadata (0 disables caching)", ge=0)
+
+# Optional leading whitespace and SQL comments, then SELECT or a WITH (CTE) query
+SELECT_QUERY_PATTERN = re.compile(
+    r"\s*(?:/\*.*?\*/\s*|--[^\n]*(?:\n|$)\s*)*(SELECT|WITH)\b",
+    re.IGNORECASE | re.DOTALL,
+)
 
-class QueryArgs(BaseModel):
+# Data-modifying statements that a WITH clause can wrap or contain
+DATA_MODIFYING_PATTERN = re.compile(r"\b(?:INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+
+def is_select_query(query: str) -> bool:
+    """Check that a query is a SELECT, or a WITH query that doesn't modify data."""
+    match = SELECT_QUERY_PATTERN.match(query)
+    if not match:
+        return False
+    if match.group(1).upper() == "WITH":
+        # A CTE can hide a write, e.g. WITH d AS (DELETE ... RETURNING *) SELECT ...
+        # The raw text is searched on purpose: quoting rules differ per database
+        # ($$...$$, E'\'', backslash escapes), so keywords inside literals are rejected too.
+        if DATA_MODIFYING_PATTERN.search(query):
+            return False
+    return True
+
+# Tool arguments are validated by hand in plain dataclasses: they are built on every
+# request and pydantic's validation machinery costs more than these few checks.
+
+def _optional_str(name: str, value: Any) -> Optional[str]:
+    """Check that an argument is a string or None."""
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"{name} must be a string")
+    return value
+
+def _required_str(name: str, value: Any, label: str) -> str:
+    """Check that an argument is a non-blank string and return it stripped."""
+    if not isinstance(value, str):
+        raise ValueError(f"{name} must be a string")
+    value = value.strip()
+    if not value:
+        raise ValueError(f"{label} cannot be empty")
+    return value
+
+_TRUE_STRINGS = frozenset(("1", "on", "t", "true", "y", "yes"))
+_FALSE_STRINGS = frozenset(("0", "off", "f", "false", "n", "no"))
+
+def _coerce_bool(name: str, value: Any) -> bool:
+    """Accept a bool, 0/1 or a yes/no style string, like pydantic's lax mode."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in _TRUE_STRINGS:
+            return True
+        if text in _FALSE_STRINGS:
+            return False
+    raise ValueError(f"{name} must be a boolean")
+
+def _coerce_int(name: str, value: Any) -> int:
+    """Accept an int, a whole-number float or an integer string, like pydantic's lax mode."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    raise ValueError(f"{name} must be an integer")
+
+def parse_arguments(cls, arguments: Dict[str, Any]):
+    """Build a tool argument dataclass from a request, ignoring unknown keys."""
+    for field in fields(cls):
+        if field.name not in arguments and field.default is MISSING and field.default_factory is MISSING:
+            raise ValueError(f"{field.name} is required")
+    return cls(**{name: arguments[name] for name in cls.__dataclass_fields__ if name in arguments})
+
+@dataclass(slots=True)
+class QueryArgs:
     """Arguments for the execute_query tool."""
-    query: str = Field(description="SQL SELECT query to execute")
-    max_rows: int = Field(default=100, description="Maximum number of rows to return", ge=1, le=1000)
-    
-    @field_validator('query')
-    def validate_query(cls, v: str) -> str:
-        if not v or not v.strip():
-            raise ValueError("Query cannot be empty")
-        
+    query: str  # SQL SELECT query to execute
+    max_rows: int = 100  # Maximum number of rows to return (1-1000)
+
+    def __post_init__(self):
+        query = _required_str("query", self.query, "Query")
         # Basic SQL injection prevention - only allow SELECT statements
-        cleaned_query = v.strip().upper()
-        if not cleaned_query.startswith("SELECT"):
+        if not is_select_query(query):
             raise ValueError("Only SELECT queries are allowed for security reasons")
-        
-        return v.strip()
+        self.query = query
 
-class GetTablesArgs(BaseModel):
+        self.max_rows = _coerce_int("max_rows", self.max_rows)
+        if not 1 <= self.max_rows <= 1000:
+            raise ValueError("max_rows must be between 1 and 1000")
+
+@dataclass(slots=True)
+class GetTablesArgs:
     """Arguments for the get_tables tool."""
-    schema: Optional[str] = Field(default=None, description="Schema name to list tables from (if None, uses default schema)")
-    include_system: bool = Field(default=False, description="Whether to include system tables")
+    schema: Optional[str] = None  # Schema name to list tables from (if None, uses default schema)
+    include_system: bool = False  # Whether to include system tables
+
+    def __post_init__(self):
+        self.schema = _optional_str("schema", self.schema)
+        self.include_system = _coerce_bool("include_system", self.include_system)
 
-class GetColumnsArgs(BaseModel):
+@dataclass(slots=True)
+class GetColumnsArgs:
     """Arguments for the get_columns tool."""
-    table_name: str = Field(description="Table name to get columns from")
-    schema: Optional[str] = Field(default=None, description="Schema name (if None, uses default schema)")
+    table_name: str  # Table name to get columns from
+    schema: Optional[str] = None  # Schema name (if None, uses default schema)
 
-    @field_validator('table_name')
-    def validate_table_name(cls, v: str) -> str:
-        if not v or not v.strip():
-            raise ValueError("Table name cannot be empty")
-        return v.strip()
+    def __post_init__(self):
+        self.table_name = _required_str("table_name", self.table_name, "Table name")
+        self.schema = _optional_str("schema", self.schema)
 
 class JdbcError(Exception):
     """Base exception for JDBC errors."""
     pass
 
+# Upper bound on cached metadata results, so probing many tables can't grow memory unbounded
+METADATA_CACHE_MAX_ENTRIES = 1024
+
+class MetadataCache:
+    """Thread-safe in-memory LRU cache of schema metadata results with per-entry TTL."""
+
+    def __init__(self, max_entries: int = METADATA_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        # (expires_at, value) per key, least recently used first
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple, value: Any, ttl: float):
+        """Store value under key for ttl seconds (a non-positive ttl disables caching)."""
+        if ttl <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (now + ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) <= self.max_entries:
+                return
+            # Over capacity: drop expired entries first, then the least recently used
+            for stale_key in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+                del self._entries[stale_key]
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+_metadata_cache = MetadataCache()
+
+# Seconds to wait for the server when validating a pooled connection before reuse
+CONNECTION_VALIDATION_TIMEOUT = 5
+
+# Pooled connections idle for longer than this many seconds are validated before reuse
+CONNECTION_VALIDATION_IDLE_TIME = 30
+
+# Rows read and JSON-encoded per chunk when streaming query results
+QUERY_CHUNK_SIZE = 100
+
+# Fixed parts of the execute_query JSON document, encoded once
+_QUERY_COLUMNS_PREFIX = b'{"columns":'
+_QUERY_ROWS_OPEN = b',"rows":['
+_QUERY_ROWS_CLOSE_ROW_COUNT = b'],"row_count":'
+_QUERY_HAS_MORE_TRUE = b',"has_more":true}'
+_QUERY_HAS_MORE_FALSE = b',"has_more":false}'
+
+# Rows fetched per driver round-trip when reading metadata result sets
+METADATA_FETCH_SIZE = 1000
+
+# Response field names for metadata rows, in result set column order
+TABLE_FIELDS = ("table_name", "schema", "type", "remarks")
+COLUMN_FIELDS = ("name", "type", "size", "nullable", "default", "remarks")
+FOREIGN_KEY_FIELDS = ("fk_name", "fk_column", "pk_table", "pk_column")
+
+# getColumns() result set columns read for COLUMN_FIELDS, and their typed getters;
+# NULLABLE is a SMALLINT (columnNoNulls=0, columnNullable=1, columnNullableUnknown=2)
+COLUMN_RESULT_COLUMNS = ("COLUMN_NAME", "TYPE_NAME", "COLUMN_SIZE", "NULLABLE", "COLUMN_DEF", "REMARKS")
+COLUMN_RESULT_GETTERS = {"COLUMN_SIZE": "getInt", "NULLABLE": "getShort"}
+
+# Single-statement catalog queries used instead of DatabaseMetaData calls for drivers
+# whose metadata calls are known to be slow. Column labels match the DatabaseMetaData
+# result sets.
+
+# Like getTables(None, schema, "%", ["TABLE"]): the schema is a LIKE pattern, NULL
+# matches every schema, and system schemas are left out. PostgreSQL reads pg_class as
+# pgjdbc does, since information_schema.tables hides tables the role has no privileges on.
+_POSTGRESQL_TABLES_QUERY = """
+SELECT c.relname AS "TABLE_NAME",
+       n.nspname AS "TABLE_SCHEM",
+       'TABLE' AS "TABLE_TYPE",
+       obj_description(c.oid, 'pg_class') AS "REMARKS"
+FROM pg_catalog.pg_class c
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+WHERE c.relkind IN ('r', 'p')
+  AND n.nspname !~ '^pg_'
+  AND n.nspname <> 'information_schema'
+  AND n.nspname LIKE COALESCE(CAST(? AS VARCHAR), '%')
+ORDER BY n.nspname, c.relname
+"""
+
+_MYSQL_TABLES_QUERY = """
+SELECT t.TABLE_NAME AS TABLE_NAME,
+       t.TABLE_SCHEMA AS TABLE_SCHEM,
+       'TABLE' AS TABLE_TYPE,
+       t.TABLE_COMMENT AS REMARKS
+FROM information_schema.TABLES t
+WHERE t.TABLE_SCHEMA LIKE COALESCE(?, '%')
+  AND t.TABLE_SCHEMA NOT IN ('information_schema', 'mysql', 'performance_schema', 'sys')
+  AND t.TABLE_TYPE = 'BASE TABLE'
+ORDER BY t.TABLE_SCHEMA, t.TABLE_NAME
+"""
+
+TABLES_QUERIES = {
+    "postgresql": _POSTGRESQL_TABLES_QUERY,
+    "mysql": _MYSQL_TABLES_QUERY,
+    "mariadb": _MYSQL_TABLES_QUERY,
+}
+
+# Columns, primary key and imported foreign keys of one table in a single round-trip.
+# ROW_KIND tells the parts apart (see COLUMN_ROW, PRIMARY_KEY_ROW, FOREIGN_KEY_ROW);
+# the schema and table name parameters are bound once per part, and a NULL schema
+# means the session's default database.
+_MYSQL_COLUMNS_QUERY = """
+SELECT 0 AS ROW_KIND,
+       c.ORDINAL_POSITION AS SORT_KEY,
+       c.COLUMN_NAME AS COLUMN_NAME,
+       -- TYPE_NAME and COLUMN_SIZE follow Connector/J's getColumns() conventions
+       CONCAT(UPPER(c.DATA_TYPE), CASE WHEN c.COLUMN_TYPE LIKE '% unsigned%' THEN ' UNSIGNED' ELSE '' END) AS TYPE_NAME,
+       CASE
+           WHEN c.DATA_TYPE IN ('datetime', 'timestamp')
+               THEN 19 + CASE WHEN c.DATETIME_PRECISION > 0 THEN c.DATETIME_PRECISION + 1 ELSE 0 END
+           WHEN c.DATA_TYPE = 'time'
+               THEN 8 + CASE WHEN c.DATETIME_PRECISION > 0 THEN c.DATETIME_PRECISION + 1 ELSE 0 END
+           WHEN c.DATA_TYPE = 'date' THEN 10
+           WHEN c.DATA_TYPE = 'year' THEN 4
+           ELSE LEAST(COALESCE(c.CHARACTER_MAXIMUM_LENGTH, c.NUMERIC_PRECISION, 0), 2147483647)
+       END AS COLUMN_SIZE,
+       CASE c.IS_NULLABLE WHEN 'YES' THEN 1 ELSE 0 END AS NULLABLE,
+       c.COLUMN_DEFAULT AS COLUMN_DEF,
+       c.COLUMN_COMMENT AS REMARKS,
+       NULL AS FK_NAME,
+       NULL AS PKTABLE_NAME,
+       NULL AS PKCOLUMN_NAME
+FROM information_schema.COLUMNS c
+WHERE c.TABLE_SCHEMA = COALESCE(?, DATABASE())
+  AND c.TABLE_NAME = ?
+UNION ALL
+SELECT 1, k.ORDINAL_POSITION, k.COLUMN_NAME,
+       NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL
+FROM information_schema.KEY_COLUMN_USAGE k
+WHERE k.CONSTRAINT_NAME = 'PRIMARY'
+  AND k.TABLE_SCHEMA = COALESCE(?, DATABASE())
+  AND k.TABLE_NAME = ?
+UNION ALL
+SELECT 2, k.ORDINAL_POSITION, k.COLUMN_NAME,
+       NULL, NULL, NULL, NULL, NULL,
+       k.CONSTRAINT_NAME, k.REFERENCED_TABLE_NAME, k.REFERENCED_COLUMN_NAME
+FROM information_schema.KEY_COLUMN_USAGE k
+WHERE k.REFERENCED_TABLE_NAME IS NOT NULL
+  AND k.TABLE_SCHEMA = COALESCE(?, DATABASE())
+  AND k.TABLE_NAME = ?
+ORDER BY 1, 9, 2
+"""
+
+# PostgreSQL stays on DatabaseMetaData: its information_schema constraint views hide
+# keys from read-only roles, and pgjdbc's COLUMN_SIZE has type-specific rules.
+COLUMNS_QUERIES = {
+    "mysql": _MYSQL_COLUMNS_QUERY,
+    "mariadb": _MYSQL_COLUMNS_QUERY,
+}
+
+COLUMN_ROW, PRIMARY_KEY_ROW, FOREIGN_KEY_ROW = 0, 1, 2
+
+def _to_records(fields: Sequence[str], rows: List[tuple]) -> List[Dict[str, Any]]:
+    """Turn row tuples into response dicts in one pass, after all per-row work is done."""
+    return [dict(zip(fields, row)) for row in rows]
+
+def _drain_result_set(rs, column_names: Sequence[str], getters: Optional[Dict[str, str]] = None) -> List[tuple]:
+    """Read the given columns of every row in a JDBC ResultSet as tuples, then close it.
+
+    Columns are read with getObject unless getters maps their name to a typed getter
+    such as "getInt", which returns a primitive instead of a boxed Java object.
+    """
+    try:
+        try:
+            rs.setFetchSize(METADATA_FETCH_SIZE)
+        except Exception as e:
+            # Fetch size is only a hint; some drivers reject it on metadata result sets
+            logger.debug("Could not set fetch size: %s", e)
+        # Resolve column positions once so each row is read by index, not by name
+        indexes = [rs.findColumn(name) for name in column_names]
+        rows = []
+        if not getters:
+            get_object = rs.getObject
+            while rs.next():
+                rows.append(tuple(map(get_object, indexes)))
+            return rows
+
+        readers = [
+            (getattr(rs, getters.get(name, "getObject")), index)
+            for name, index in zip(column_names, indexes)
+        ]
+        while rs.next():
+            rows.append(tuple(read(index) for read, index in readers))
+        return rows
+    finally:
+        rs.close()
+
+def metadata_cache_key(config: JdbcConfig, kind: str, *args: Any) -> tuple:
+    """Build a metadata cache key scoped to a configuration's database and user."""
+    return (kind, config.jdbc_url, config.username) + args
+
+def invalidate_metadata():
+    """Discard all cached table and column metadata."""
+    _metadata_cache.clear()
+
+def jdbc_dialect(jdbc_url: str) -> Optional[str]:
+    """Return the lower-cased subprotocol of a JDBC URL, e.g. "postgresql"."""
+    parts = jdbc_url.split(":", 2)
+    if len(parts) < 3 or parts[0].lower() != "jdbc":
+        return None
+    return parts[1].lower()
+
+def _get_object(rs, col: int) -> Any:
+    """Fallback converter for SQL types jaydebeapi has no converter for."""
+    return rs.getObject(col)
+
+def verify_config(config: JdbcConfig):
+    """Verify that the configuration is valid."""
+    if not config.jdbc_url:
+        raise JdbcError("JDBC URL is required")
+    if not config.jdbc_driver:
+        raise JdbcError("JDBC driver class name is required")
+    if not config.jdbc_driver_path:
+        raise JdbcError("JDBC driver JAR path is required")
+    if not os.path.exists(config.jdbc_driver_path):
+        raise JdbcError(f"JDBC driver JAR not found at {config.jdbc_driver_path}")
+
+def start_jvm(config: JdbcConfig):
+    """Start the JVM with the JDBC driver on its classpath and register the driver."""
+    if jpype.isJVMStarted():
+        return
+    verify_config(config)
+    jpype.startJVM(classpath=[config.jdbc_driver_path], convertStrings=True)
+    # Loading the driver class registers it with DriverManager once for the process
+    jpype.JClass(config.jdbc_driver)
+
 class JdbcClient:
     """Client for interacting with a database via JDBC."""
     
-    def __init__(self, config: JdbcConfig):
+    def __init__(self, config: JdbcConfig, verify: bool = True):
         self.config = config
         self._connection = None
-        self._verify_config()
-
-    def _verify_config(self):
-        """Verify that the configuration is valid."""
-        if not self.config.jdbc_url:
-            raise JdbcError("JDBC URL is required")
-        if not self.config.jdbc_driver:
-            raise JdbcError("JDBC driver class name is required")
-        if not self.config.jdbc_driver_path:
-            raise JdbcError("JDBC driver JAR path is required")
-        if not os.path.exists(self.config.jdbc_driver_path):
-            raise JdbcError(f"JDBC driver JAR not found at {self.config.jdbc_driver_path}")
+        self._metadata = None
+        self._dialect = jdbc_dialect(config.jdbc_url)
+        # Prepared statements keyed by SQL text, least recently used first
+        self._statements: "OrderedDict[str, Any]" = OrderedDict()
+        if verify:
+            verify_config(config)
 
     def connect(self) -> bool:
         """Establish a database connection."""
@@ -113,13 +459,82 @@ class JdbcClient:
                 [self.config.username, self.config.password],
                 self.config.jdbc_driver_path,
             )
+            # Enforce read-only in the database too: with autocommit off, each borrow runs
+            # in a read-only transaction (pgjdbc ignores read-only under autocommit) that
+            # is rolled back when the client goes back to the pool
+            self._connection.jconn.setAutoCommit(False)
+            self._connection.jconn.setReadOnly(True)
             return True
         except Exception as e:
             logger.error(f"Failed to connect to database: {str(e)}")
             raise JdbcError(f"Connection failed: {str(e)}")
 
+    def is_connected(self) -> bool:
+        """Check whether the underlying JDBC connection is still open."""
+        if not self._connection:
+            return False
+        try:
+            return not self._connection.jconn.isClosed()
+        except Exception as e:
+            logger.warning(f"Connection health check failed: {str(e)}")
+            return False
+
+    def rollback(self) -> bool:
+        """End the current read-only transaction, returning False if that failed."""
+        if not self._connection:
+            return False
+        try:
+            self._connection.jconn.rollback()
+            return True
+        except Exception as e:
+            logger.warning(f"Rollback failed: {str(e)}")
+            return False
+
+    def is_valid(self, timeout: int = CONNECTION_VALIDATION_TIMEOUT) -> bool:
+        """Check with the server that the connection still works.
+
+        Unlike is_connected(), this notices sockets dropped by the server or a firewall.
+        """
+        if not self._connection:
+            return False
+        try:
+            return bool(self._connection.jconn.isValid(timeout))
+        except Exception as e:
+            logger.warning(f"Connection validation failed: {str(e)}")
+            return False
+
+    def _close_statement(self, statement):
+        """Close a JDBC statement, logging rather than raising on failure."""
+        try:
+            statement.close()
+        except Exception as e:
+            logger.warning(f"Error closing prepared statement: {str(e)}")
+
+    def _prepare(self, query: str):
+        """Return a PreparedStatement for query, reusing a cached one when possible."""
+        statement = self._statements.get(query)
+        if statement is not None:
+            self._statements.move_to_end(query)
+            return statement
+
+        statement = self._connection.jconn.prepareStatement(query)
+        self._statements[query] = statement
+        while len(self._statements) > self.config.statement_cache_size:
+            _, evicted = self._statements.popitem(last=False)
+            self._close_statement(evicted)
+        return statement
+
+    def _evict_statement(self, query: str):
+        """Drop and close the cached statement for query, if any."""
+        statement = self._statements.pop(query, None)
+        if statement is not None:
+            self._close_statement(statement)
+
     def close(self):
         """Close the database connection."""
+        for statement in self._statements.values():
+            self._close_statement(statement)
+        self._statements.clear()
         if self._connection:
             try:
                 self._connection.close()
@@ -127,157 +542,398 @@ class JdbcClient:
                 logger.error(f"Error closing connection: {str(e)}")
             finally:
                 self._connection = None
+                self._metadata = None
 
-    def execute_query(self, query: str, max_rows: int = 100) -> Dict[str, Any]:
-        """Execute a SELECT query and return results."""
+    @contextmanager
+    def _query_result(self, query: str, max_rows: int) -> Iterator[tuple]:
+        """Execute a query and yield its open ResultSet, column labels and value converters."""
         if not self._connection:
             self.connect()
 
         try:
-            with self._connection.cursor() as cursor:
-                cursor.execute(query)
-                columns = [desc[0] for desc in cursor.description]
-                rows = cursor.fetchmany(max_rows)
-                
-                return {
-                    "columns": columns,
-                    "rows": [list(row) for row in rows],
-                    "row_count": len(rows),
-                    "has_more": cursor.fetchone() is not None
-                }
+            statement = self._prepare(query)
+            # Let the server stop after max_rows + 1 rows (the extra one answers has_more)
+            # and deliver them in a single fetch. Set on every run since statements are reused.
+            statement.setMaxRows(max_rows + 1)
+            statement.setFetchSize(max_rows + 1)
+            rs = statement.executeQuery()
+            try:
+                meta = rs.getMetaData()
+                column_range = range(1, meta.getColumnCount() + 1)
+                # map() keeps the per-column loop in C for wide result sets
+                columns = list(map(meta.getColumnLabel, column_range))
+                # Reuse jaydebeapi's per-SQL-type converters so values match cursor.fetch*()
+                known_converters = self._connection._converters
+                converters = list(zip(
+                    column_range,
+                    map(known_converters.get, map(meta.getColumnType, column_range), repeat(_get_object)),
+                ))
+                yield rs, columns, converters
+            finally:
+                rs.close()
         except Exception as e:
+            # A statement that failed may be left in a bad state; don't reuse it
+            self._evict_statement(query)
             logger.error(f"Query execution failed: {str(e)}")
             raise JdbcError(f"Query failed: {str(e)}")
 
+    @staticmethod
+    def _read_rows(rs, converters: List[tuple], limit: int) -> List[tuple]:
+        """Read up to limit rows from the ResultSet's current position."""
+        rows = []
+        while len(rows) < limit and rs.next():
+            rows.append(tuple(convert(rs, i) for i, convert in converters))
+        return rows
+
+    def stream_query_json(self, query: str, max_rows: int = 100, chunk_size: int = QUERY_CHUNK_SIZE) -> Iterator[bytes]:
+        """Execute a SELECT query and yield its results as JSON fragments.
+
+        Rows are fetched and encoded chunk_size at a time, so only one chunk is held as
+        Python objects. The joined fragments form one document with columns, rows,
+        row_count and has_more keys.
+        """
+        with self._query_result(query, max_rows) as (rs, columns, converters):
+            yield _QUERY_COLUMNS_PREFIX + to_json(columns) + _QUERY_ROWS_OPEN
+
+            row_count = 0
+            exhausted = False
+            while row_count < max_rows:
+                limit = min(chunk_size, max_rows - row_count)
+                rows = self._read_rows(rs, converters, limit)
+                if rows:
+                    # Strip the list brackets so chunks splice into one JSON array
+                    chunk = to_json(rows)[1:-1]
+                    yield chunk if row_count == 0 else b"," + chunk
+                    row_count += len(rows)
+                if len(rows) < limit:
+                    exhausted = True
+                    break
+
+            has_more = not exhausted and rs.next()
+            yield b"".join((
+                _QUERY_ROWS_CLOSE_ROW_COUNT,
+                str(row_count).encode(),
+                _QUERY_HAS_MORE_TRUE if has_more else _QUERY_HAS_MORE_FALSE,
+            ))
+
+    def _query_metadata(
+        self,
+        query: str,
+        column_names: Sequence[str],
+        *params: Optional[str],
+        getters: Optional[Dict[str, str]] = None,
+    ) -> Optional[List[tuple]]:
+        """Run a catalog query with string parameters, or return None if it fails."""
+        try:
+            statement = self._prepare(query)
+            for i, param in enumerate(params, 1):
+                statement.setString(i, param)
+            return _drain_result_set(statement.executeQuery(), column_names, getters)
+        except Exception as e:
+            self._evict_statement(query)
+            # Some databases (e.g. PostgreSQL) abort the transaction on error; clear it
+            # so the DatabaseMetaData fallback can run
+            self.rollback()
+            logger.warning(f"Catalog query failed, falling back to DatabaseMetaData: {str(e)}")
+            return None
+
+    def _get_metadata(self):
+        """Return the connection's DatabaseMetaData, fetching it once per connection."""
+        if self._metadata is None:
+            self._metadata = self._connection.jconn.getMetaData()
+        return self._metadata
+
+    def _cache_key(self, kind: str, *args: Any) -> tuple:
+        """Build a metadata cache key scoped to this client's database and user."""
+        return metadata_cache_key(self.config, kind, *args)
+
     def get_tables(self, schema: Optional[str] = None, include_system: bool = False) -> Dict[str, Any]:
         """Get list of tables in the database."""
+        key = self._cache_key("tables", schema, include_system)
+        cached = _metadata_cache.get(key)
+        if cached is not None:
+            return cached
+
         if not self._connection:
             self.connect()
 
         try:
-            cursor = self._connection.cursor()
-            # Use DatabaseMetaData through the connection directly
-            metadata = self._connection.jconn.getMetaData()
-            rs = metadata.getTables(None, schema, "%", ["TABLE"] if not include_system else None)
+            column_names = ("TABLE_NAME", "TABLE_SCHEM", "TABLE_TYPE", "REMARKS")
+            rows = None
+            fast_query = TABLES_QUERIES.get(self._dialect)
+            # The fast path only covers user tables; system tables need the driver's view
+            if fast_query and not include_system:
+                rows = self._query_metadata(fast_query, column_names, schema)
+            if rows is None:
+                metadata = self._get_metadata()
+                rs = metadata.getTables(None, schema, "%", ["TABLE"] if not include_system else None)
+                rows = _drain_result_set(rs, column_names)
             
-            tables = []
-            while rs.next():
-                tables.append({
-                    "table_name": rs.getString("TABLE_NAME"),
-                    "schema": rs.getString("TABLE_SCHEM"),
-                    "type": rs.getString("TABLE_TYPE"),
-                    "remarks": rs.getString("REMARKS")
-                })
+            tables = _to_records(TABLE_FIELDS, rows)
             
-            return {
+            result = {
                 "tables": tables,
                 "count": len(tables)
             }
+            _metadata_cache.put(key, result, self.config.metadata_cache_ttl)
+            return result
         except Exception as e:
             logger.error(f"Failed to get tables: {str(e)}")
             raise JdbcError(f"Failed to get tables: {str(e)}")
-        finally:
-            if 'cursor' in locals():
-                cursor.close()
+
+    def _get_primary_keys(self, table_name: str, schema: Optional[str]) -> List[str]:
+        """Get the primary key column names of a table."""
+        key = self._cache_key("primary_keys", schema, table_name)
+        cached = _metadata_cache.get(key)
+        if cached is not None:
+            return cached
+
+        rs = self._get_metadata().getPrimaryKeys(None, schema, table_name)
+        pk_columns = [row[0] for row in _drain_result_set(rs, ("COLUMN_NAME",))]
+
+        _metadata_cache.put(key, pk_columns, self.config.metadata_cache_ttl)
+        return pk_columns
+
+    def _get_foreign_keys(self, table_name: str, schema: Optional[str]) -> List[Dict[str, Any]]:
+        """Get the foreign keys a table imports from other tables."""
+        key = self._cache_key("foreign_keys", schema, table_name)
+        cached = _metadata_cache.get(key)
+        if cached is not None:
+            return cached
+
+        rs = self._get_metadata().getImportedKeys(None, schema, table_name)
+        rows = _drain_result_set(rs, ("FK_NAME", "FKCOLUMN_NAME", "PKTABLE_NAME", "PKCOLUMN_NAME"))
+
+        foreign_keys = _to_records(FOREIGN_KEY_FIELDS, rows)
+
+        _metadata_cache.put(key, foreign_keys, self.config.metadata_cache_ttl)
+        return foreign_keys
+
+    def _get_columns_combined(self, table_name: str, schema: Optional[str]) -> Optional[tuple]:
+        """Get columns, primary key and foreign keys with one catalog query.
+
+        Returns None when the driver has no such query or it fails, so the caller
+        can fall back to the three DatabaseMetaData calls.
+        """
+        query = COLUMNS_QUERIES.get(self._dialect)
+        if not query:
+            return None
+        rows = self._query_metadata(
+            query,
+            ("ROW_KIND",) + COLUMN_RESULT_COLUMNS + ("FK_NAME", "PKTABLE_NAME", "PKCOLUMN_NAME"),
+            schema, table_name, schema, table_name, schema, table_name,
+            getters=dict(COLUMN_RESULT_GETTERS, ROW_KIND="getShort"),
+        )
+        if rows is None:
+            return None
+
+        columns, pk_columns, foreign_keys = [], [], []
+        for kind, name, type_name, size, nullable, default, remarks, fk_name, pk_table, pk_column in rows:
+            if kind == COLUMN_ROW:
+                columns.append((name, type_name, size, nullable != 0, default, remarks))
+            elif kind == PRIMARY_KEY_ROW:
+                pk_columns.append(name)
+            elif kind == FOREIGN_KEY_ROW:
+                foreign_keys.append((fk_name, name, pk_table, pk_column))
+        foreign_keys = _to_records(FOREIGN_KEY_FIELDS, foreign_keys)
+
+        # Keep the per-table key caches in step with what this query returned
+        ttl = self.config.metadata_cache_ttl
+        _metadata_cache.put(self._cache_key("primary_keys", schema, table_name), pk_columns, ttl)
+        _metadata_cache.put(self._cache_key("foreign_keys", schema, table_name), foreign_keys, ttl)
+        return _to_records(COLUMN_FIELDS, columns), pk_columns, foreign_keys
 
     def get_columns(self, table_name: str, schema: Optional[str] = None) -> Dict[str, Any]:
         """Get column information for a table."""
+        key = self._cache_key("columns", schema, table_name)
+        cached = _metadata_cache.get(key)
+        if cached is not None:
+            return cached
+
         if not self._connection:
             self.connect()
 
         try:
-            cursor = self._connection.cursor()
-            # Use DatabaseMetaData through the connection directly
-            metadata = self._connection.jconn.getMetaData()
-            rs = metadata.getColumns(None, schema, table_name, "%")
-            
-            columns = []
-            while rs.next():
-                columns.append({
-                    "name": rs.getString("COLUMN_NAME"),
-                    "type": rs.getString("TYPE_NAME"),
-                    "size": rs.getInt("COLUMN_SIZE"),
-                    "nullable": rs.getBoolean("NULLABLE"),
-                    "default": rs.getString("COLUMN_DEF"),
-                    "remarks": rs.getString("REMARKS")
-                })
-            
-            # Get primary key information
-            rs = metadata.getPrimaryKeys(None, schema, table_name)
-            pk_columns = []
-            while rs.next():
-                pk_columns.append(rs.getString("COLUMN_NAME"))
-            
-            # Get foreign key information
-            rs = metadata.getImportedKeys(None, schema, table_name)
-            foreign_keys = []
-            while rs.next():
-                foreign_keys.append({
-                    "fk_name": rs.getString("FK_NAME"),
-                    "fk_column": rs.getString("FKCOLUMN_NAME"),
-                    "pk_table": rs.getString("PKTABLE_NAME"),
-                    "pk_column": rs.getString("PKCOLUMN_NAME")
-                })
+            combined = self._get_columns_combined(table_name, schema)
+            if combined is not None:
+                columns, pk_columns, foreign_keys = combined
+            else:
+                metadata = self._get_metadata()
+                rs = metadata.getColumns(None, schema, table_name, "%")
+                rows = _drain_result_set(rs, COLUMN_RESULT_COLUMNS, COLUMN_RESULT_GETTERS)
+                
+                rows = [
+                    (name, type_name, size, nullable != 0, default, remarks)
+                    for name, type_name, size, nullable, default, remarks in rows
+                ]
+                columns = _to_records(COLUMN_FIELDS, rows)
+                pk_columns = self._get_primary_keys(table_name, schema)
+                foreign_keys = self._get_foreign_keys(table_name, schema)
             
-            return {
+            result = {
                 "table_name": table_name,
                 "schema": schema,
                 "columns": columns,
                 "primary_keys": pk_columns,
                 "foreign_keys": foreign_keys
             }
+            _metadata_cache.put(key, result, self.config.metadata_cache_ttl)
+            return result
         except Exception as e:
             logger.error(f"Failed to get columns for table {table_name}: {str(e)}")
             raise JdbcError(f"Failed to get columns: {str(e)}")
+
+class JdbcConnectionPool:
+    """Pool of connected JdbcClient instances reused across requests."""
+
+    def __init__(self, config: JdbcConfig):
+        # The configuration is fixed for the pool's lifetime, so check it only once
+        verify_config(config)
+        self.config = config
+        # Idle clients with the time they were returned, most recently used last
+        self._idle: List[tuple] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> JdbcClient:
+        """Take an open client from the pool, connecting a new one if none is idle."""
+        while True:
+            with self._lock:
+                client, released_at = self._idle.pop() if self._idle else (None, 0.0)
+            if client is None:
+                break
+            # Only ask the server about connections idle long enough to have been dropped
+            if time.monotonic() - released_at < CONNECTION_VALIDATION_IDLE_TIME:
+                if client.is_connected():
+                    return client
+            elif client.is_valid():
+                return client
+            # Stale connection (e.g. dropped by the server); discard it and try the next one
+            client.close()
+
+        client = JdbcClient(self.config, verify=False)
+        client.connect()
+        return client
+
+    def release(self, client: JdbcClient):
+        """Return a client to the pool, closing it if it is broken or the pool is full."""
+        if client.is_connected() and client.rollback():
+            with self._lock:
+                if len(self._idle) < self.config.pool_size:
+                    self._idle.append((client, time.monotonic()))
+                    return
+        client.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[JdbcClient]:
+        """Borrow a client for the duration of a `with` block."""
+        client = self.acquire()
+        broken = False
+        try:
+            yield client
+        except JdbcError:
+            # Bad SQL raises JdbcError too; only drop connections that stopped working
+            broken = not (client.rollback() and client.is_valid())
+            raise
         finally:
-            if 'cursor' in locals():
-                cursor.close()
+            if broken:
+                client.close()
+            else:
+                self.release(client)
+
+    def close_all(self):
+        """Close every idle connection held by the pool."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for client, _ in idle:
+            client.close()
+
+# Environment settings don't change at runtime; build the configuration once
+_config = JdbcConfig()
+_pool: Optional[JdbcConnectionPool] = None
+_pool_lock = threading.Lock()
+
+def get_pool() -> JdbcConnectionPool:
+    """Return the process-wide connection pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = JdbcConnectionPool(_config)
+        return _pool
+
+def close_pool():
+    """Close all pooled connections and discard the process-wide pool."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close_all()
+    invalidate_metadata()
+
+# (Clob, Blob, SQLXML) classes, resolved once the JVM is running
+_lob_classes: Optional[tuple] = None
+
+def _json_default(value: Any) -> Any:
+    """Convert Java values returned by JDBC that orjson cannot encode itself."""
+    global _lob_classes
+    # Only reached when the JVM was started elsewhere with convertStrings=False
+    if isinstance(value, jpype.JString):
+        return str(value)
+    if isinstance(value, jpype.JObject):
+        if _lob_classes is None:
+            _lob_classes = tuple(jpype.JClass(name) for name in ("java.sql.Clob", "java.sql.Blob", "java.sql.SQLXML"))
+        clob_class, blob_class, sqlxml_class = _lob_classes
+        if isinstance(value, clob_class):
+            return str(value.getSubString(1, int(value.length())))
+        if isinstance(value, blob_class):
+            data = bytes(value.getBytes(1, int(value.length())))
+            return base64.b64encode(data).decode("ascii")
+        if isinstance(value, sqlxml_class):
+            return str(value.getString())
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def to_json(value: Any) -> bytes:
+    """Serialize a value to JSON bytes.
+
+    Java LOBs (CLOB/NCLOB and SQLXML as text, BLOB as base64) are converted; any
+    other value orjson cannot encode raises TypeError.
+    """
+    return orjson.dumps(value, default=_json_default)
 
 # MCP handlers
 async def execute_query(arguments: Dict[str, Any]) -> bytes:
     """Handle execute_query requests."""
     try:
-        args = QueryArgs(**arguments)
-        config = JdbcConfig()
-        client = JdbcClient(config)
-        
-        result = client.execute_query(args.query, args.max_rows)
-        return json.dumps(result).encode()
+        args = parse_arguments(QueryArgs, arguments)
+        with get_pool().connection() as client:
+            return b"".join(client.stream_query_json(args.query, args.max_rows))
     except Exception as e:
-        return json.dumps({"error": str(e)}).encode()
-    finally:
-        if 'client' in locals():
-            client.close()
+        return to_json({"error": str(e)})
 
 async def get_tables(arguments: Dict[str, Any]) -> bytes:
     """Handle get_tables requests."""
     try:
-        args = GetTablesArgs(**arguments)
-        config = JdbcConfig()
-        client = JdbcClient(config)
-        
-        result = client.get_tables(args.schema, args.include_system)
-        return json.dumps(result).encode()
+        args = parse_arguments(GetTablesArgs, arguments)
+        # Serve cache hits without borrowing (or validating) a pooled connection
+        result = _metadata_cache.get(metadata_cache_key(_config, "tables", args.schema, args.include_system))
+        if result is None:
+            with get_pool().connection() as client:
+                result = client.get_tables(args.schema, args.include_system)
+        return to_json(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}).encode()
-    finally:
-        if 'client' in locals():
-            client.close()
+        return to_json({"error": str(e)})
 
 async def get_columns(arguments: Dict[str, Any]) -> bytes:
     """Handle get_columns requests."""
     try:
-        args = GetColumnsArgs(**arguments)
-        config = JdbcConfig()
-        client = JdbcClient(config)
-        
-        result = client.get_columns(args.table_name, args.schema)
-        return json.dumps(result).encode()
+        args = parse_arguments(GetColumnsArgs, arguments)
+        # Serve cache hits without borrowing (or validating) a pooled connection
+        result = _metadata_cache.get(metadata_cache_key(_config, "columns", args.schema, args.table_name))
+        if result is None:
+            with get_pool().connection() as client:
+                result = client.get_columns(args.table_name, args.schema)
+        return to_json(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}).encode()
-    finally:
-        if 'client' in locals():
-            client.close()
+        return to_json({"error": str(e)})
 
 @app.command()
 def main(
@@ -286,6 +942,12 @@ def main(
     port: int = typer.Option(8000, help="Port to listen on"),
 ):
     """Run the JDBC MCP server."""
+    # Pay the JVM startup cost before serving rather than on the first request
+    try:
+        start_jvm(_config)
+    except Exception as e:
+        logger.error(f"Failed to start JVM: {str(e)}")
+
     mcp = FastMCP()
     
     mcp.add_tool(
@@ -344,10 +1006,13 @@ Example:
     )
     
     # Run server
-    if transport == Transport.stdio:
-        mcp.run(transport="stdio")
-    else:
-        mcp.run(transport="sse", host=host, port=port)
+    try:
+        if transport == Transport.stdio:
+            mcp.run(transport="stdio")
+        else:
+            mcp.run(transport="sse", host=host, port=port)
+    finally:
+        close_pool()
 
 if __name__ == "__main__":
     app() 
\ No newline at end of file
@@ -0,0 +1,23 @@
+import pytest
+from pydantic import ValidationError
+
+from simple_jdbc import JdbcConfig
+
+
+def test_reads_environment_at_instantiation(monkeypatch):
+    monkeypatch.setenv("JDBC_URL", "jdbc:h2:mem:test")
+    monkeypatch.setenv("JDBC_POOL_SIZE", "3")
+    config = JdbcConfig()
+    assert config.jdbc_url == "jdbc:h2:mem:test"
+    assert config.pool_size == 3
+
+
+@pytest.mark.parametrize("name, value", [
+    ("JDBC_POOL_SIZE", "0"),
+    ("JDBC_STATEMENT_CACHE_SIZE", "0"),
+    ("JDBC_METADATA_CACHE_TTL", "-1"),
+])
+def test_rejects_out_of_range_environment_values(monkeypatch, name, value):
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValidationError):
+        JdbcConfig()
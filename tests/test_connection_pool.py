@@ -0,0 +1,85 @@
+import pytest
+
+import simple_jdbc
+from simple_jdbc import JdbcConfig, JdbcConnectionPool, JdbcError
+
+
+class FakeJavaConnection:
+    def __init__(self):
+        self.closed = False
+        self.valid = True
+        self.validations = 0
+
+    def setAutoCommit(self, auto_commit):
+        pass
+
+    def setReadOnly(self, read_only):
+        pass
+
+    def isClosed(self):
+        return self.closed
+
+    def isValid(self, timeout):
+        self.validations += 1
+        return self.valid
+
+    def rollback(self):
+        if not self.valid:
+            raise RuntimeError("connection reset")
+
+
+class FakeConnection:
+    def __init__(self):
+        self.jconn = FakeJavaConnection()
+
+    def close(self):
+        self.jconn.closed = True
+
+
+@pytest.fixture
+def pool(monkeypatch, tmp_path):
+    driver = tmp_path / "driver.jar"
+    driver.write_bytes(b"")
+    monkeypatch.setattr(simple_jdbc.jaydebeapi, "connect", lambda *args: FakeConnection())
+    return JdbcConnectionPool(JdbcConfig(
+        jdbc_url="jdbc:h2:mem:test", jdbc_driver="org.h2.Driver", jdbc_driver_path=str(driver),
+    ))
+
+
+def test_reuses_recently_released_connection_without_validation(pool):
+    with pool.connection() as client:
+        first = client
+    with pool.connection() as client:
+        assert client is first
+    assert first._connection.jconn.validations == 0
+
+
+def test_validates_connections_idle_past_threshold(pool, monkeypatch):
+    with pool.connection() as client:
+        first = client
+    now = simple_jdbc.time.monotonic() + simple_jdbc.CONNECTION_VALIDATION_IDLE_TIME + 1
+    monkeypatch.setattr(simple_jdbc.time, "monotonic", lambda: now)
+    first._connection.jconn.valid = False
+    with pool.connection() as client:
+        assert client is not first
+    assert first._connection is None
+
+
+def test_keeps_connection_after_query_error(pool):
+    with pytest.raises(JdbcError):
+        with pool.connection() as client:
+            first = client
+            raise JdbcError("Query failed: syntax error")
+    with pool.connection() as client:
+        assert client is first
+
+
+def test_discards_broken_connection_after_error(pool):
+    with pytest.raises(JdbcError):
+        with pool.connection() as client:
+            first = client
+            first._connection.jconn.valid = False
+            raise JdbcError("Query failed: connection reset")
+    assert first._connection is None
+    with pool.connection() as client:
+        assert client is not first
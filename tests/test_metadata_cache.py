@@ -0,0 +1,52 @@
+import asyncio
+import json
+
+import simple_jdbc
+from simple_jdbc import MetadataCache
+
+
+def test_expired_entries_are_not_returned(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("simple_jdbc.time.monotonic", lambda: now[0])
+    cache = MetadataCache()
+    cache.put(("tables",), ["users"], ttl=60)
+    assert cache.get(("tables",)) == ["users"]
+    now[0] += 61
+    assert cache.get(("tables",)) is None
+
+
+def test_evicts_least_recently_used_entry_when_full():
+    cache = MetadataCache(max_entries=2)
+    cache.put(("a",), 1, ttl=60)
+    cache.put(("b",), 2, ttl=60)
+    cache.get(("a",))
+    cache.put(("c",), 3, ttl=60)
+    assert cache.get(("a",)) == 1
+    assert cache.get(("b",)) is None
+    assert cache.get(("c",)) == 3
+
+
+def test_purges_expired_entries_before_evicting_live_ones(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("simple_jdbc.time.monotonic", lambda: now[0])
+    cache = MetadataCache(max_entries=2)
+    cache.put(("live",), 1, ttl=60)
+    cache.put(("short",), 2, ttl=1)
+    now[0] += 2
+    cache.put(("new",), 3, ttl=60)
+    assert cache.get(("live",)) == 1
+    assert cache.get(("new",)) == 3
+
+
+def test_handlers_serve_cache_hits_without_the_pool(monkeypatch):
+    def unreachable_pool():
+        raise AssertionError("cache hit must not borrow a connection")
+
+    monkeypatch.setattr(simple_jdbc, "get_pool", unreachable_pool)
+    key = simple_jdbc.metadata_cache_key(simple_jdbc._config, "tables", "public", False)
+    simple_jdbc._metadata_cache.put(key, {"tables": [], "count": 0}, ttl=60)
+    try:
+        response = asyncio.run(simple_jdbc.get_tables({"schema": "public"}))
+    finally:
+        simple_jdbc.invalidate_metadata()
+    assert json.loads(response) == {"tables": [], "count": 0}
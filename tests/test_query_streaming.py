@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from simple_jdbc import JdbcClient, JdbcConfig
+
+
+class FakeMetaData:
+    def getColumnCount(self):
+        return 2
+
+    def getColumnLabel(self, index):
+        return ("id", "name")[index - 1]
+
+    def getColumnType(self, index):
+        return 4
+
+
+class FakeResultSet:
+    def __init__(self, row_count):
+        self.row_count = row_count
+        self.position = 0
+
+    def getMetaData(self):
+        return FakeMetaData()
+
+    def next(self):
+        self.position += 1
+        return self.position <= self.row_count
+
+    def getObject(self, index):
+        return self.position if index == 1 else f"row {self.position}"
+
+    def close(self):
+        pass
+
+
+class FakeStatement:
+    def __init__(self, row_count):
+        self.row_count = row_count
+        self.max_rows = 0
+
+    def setMaxRows(self, max_rows):
+        self.max_rows = max_rows
+
+    def setFetchSize(self, fetch_size):
+        pass
+
+    def executeQuery(self):
+        return FakeResultSet(min(self.row_count, self.max_rows))
+
+
+class FakeConnection:
+    _converters = {}
+
+    def __init__(self, row_count):
+        self.jconn = self
+        self.row_count = row_count
+
+    def prepareStatement(self, query):
+        return FakeStatement(self.row_count)
+
+
+def stream(row_count, max_rows, chunk_size):
+    client = JdbcClient(JdbcConfig(jdbc_url="jdbc:h2:mem:test"), verify=False)
+    client._connection = FakeConnection(row_count)
+    return json.loads(b"".join(client.stream_query_json("SELECT id, name FROM t", max_rows, chunk_size)))
+
+
+@pytest.mark.parametrize("row_count, max_rows, chunk_size", [
+    (0, 10, 3),
+    (5, 10, 3),
+    (9, 9, 3),
+    (10, 9, 3),
+    (250, 100, 100),
+])
+def test_streams_rows_up_to_max_rows(row_count, max_rows, chunk_size):
+    result = stream(row_count, max_rows, chunk_size)
+    expected_rows = min(row_count, max_rows)
+    assert result["columns"] == ["id", "name"]
+    assert result["rows"] == [[i, f"row {i}"] for i in range(1, expected_rows + 1)]
+    assert result["row_count"] == expected_rows
+    assert result["has_more"] is (row_count > max_rows)
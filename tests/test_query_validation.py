@@ -0,0 +1,43 @@
+import pytest
+
+from simple_jdbc import QueryArgs, is_select_query, parse_arguments
+
+
+@pytest.mark.parametrize("query", [
+    "SELECT 1",
+    "  select * from users",
+    "/* report */ -- daily\nSELECT id FROM orders",
+    "WITH recent AS (SELECT * FROM orders) SELECT * FROM recent",
+    "SELECT 'delete me' AS note",
+])
+def test_accepts_read_only_queries(query):
+    assert is_select_query(query)
+
+
+@pytest.mark.parametrize("query", [
+    "DELETE FROM t",
+    "UPDATE t SET a = 1",
+    "-- SELECT\nDROP TABLE t",
+    "/* SELECT */ INSERT INTO t VALUES (1)",
+    "SELECTED",
+    "WITH x AS (SELECT 1) DELETE FROM t",
+    "WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d",
+    "with u as (update t set a = 1 returning a) select * from u",
+    "WITH x AS (SELECT 1) INSERT INTO t SELECT * FROM x",
+    "WITH s AS (SELECT 1) MERGE INTO t USING s ON true WHEN MATCHED THEN DELETE",
+    # Quoting tricks that hide a write from a literal-aware scanner
+    "WITH a AS (SELECT $$'$$ AS q), d AS (DELETE FROM t RETURNING 1) SELECT 'x' FROM d",
+    "WITH a AS (SELECT $tag$'$tag$ AS q), d AS (DELETE FROM t RETURNING 1) SELECT 'x' FROM d",
+    "WITH a AS (SELECT E'\\'' AS q), d AS (DELETE FROM t RETURNING 1) SELECT 'x' FROM d",
+    "WITH a AS (SELECT 'a\\' AS q), d AS (DELETE FROM t RETURNING 1) SELECT 'x' FROM d",
+    # Keywords inside literals or comments are rejected too (fail closed)
+    "WITH notes AS (SELECT 'delete me' AS note) SELECT * FROM notes",
+    "WITH x AS (SELECT 1) /* no DELETE here */ SELECT * FROM x",
+])
+def test_rejects_other_statements(query):
+    assert not is_select_query(query)
+
+
+def test_query_args_rejects_data_modifying_cte():
+    with pytest.raises(ValueError, match="Only SELECT queries"):
+        parse_arguments(QueryArgs, {"query": "WITH x AS (SELECT 1) DELETE FROM t"})
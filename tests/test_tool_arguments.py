@@ -0,0 +1,44 @@
+import pytest
+
+from simple_jdbc import GetColumnsArgs, GetTablesArgs, QueryArgs, parse_arguments
+
+
+def test_query_args_coerce_like_pydantic_lax_mode():
+    args = parse_arguments(QueryArgs, {"query": " SELECT 1 ", "max_rows": 50.0, "extra": True})
+    assert args.query == "SELECT 1"
+    assert args.max_rows == 50
+    assert parse_arguments(QueryArgs, {"query": "SELECT 1", "max_rows": "7"}).max_rows == 7
+
+
+@pytest.mark.parametrize("max_rows", [0, 1001, 2.5, True, "many"])
+def test_query_args_reject_invalid_max_rows(max_rows):
+    with pytest.raises(ValueError, match="max_rows"):
+        parse_arguments(QueryArgs, {"query": "SELECT 1", "max_rows": max_rows})
+
+
+@pytest.mark.parametrize("cls, message", [
+    (QueryArgs, "query is required"),
+    (GetColumnsArgs, "table_name is required"),
+])
+def test_missing_required_argument(cls, message):
+    with pytest.raises(ValueError, match=message):
+        parse_arguments(cls, {})
+
+
+def test_get_tables_args_defaults_and_bool_coercion():
+    assert parse_arguments(GetTablesArgs, {}) == GetTablesArgs(schema=None, include_system=False)
+    assert parse_arguments(GetTablesArgs, {"include_system": "true"}).include_system is True
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("yes", True), ("On", True), ("t", True), ("Y", True), (1.0, True),
+    ("no", False), ("OFF", False), ("f", False), ("n", False), (0.0, False),
+])
+def test_include_system_accepts_pydantic_lax_booleans(value, expected):
+    assert parse_arguments(GetTablesArgs, {"include_system": value}).include_system is expected
+
+
+@pytest.mark.parametrize("value", [2, 0.5, "maybe", None])
+def test_include_system_rejects_non_booleans(value):
+    with pytest.raises(ValueError, match="include_system"):
+        parse_arguments(GetTablesArgs, {"include_system": value})